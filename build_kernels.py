@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the Numba path kernels
+=============================================
+Compiles the circle and triangle kernels of ``drone_flight_generator.py`` into
+a native ``flight_kernels`` extension next to this file.  It loads in well
+under a millisecond and needs no Numba at runtime, so flights of
+``AOT_MIN_PTS`` samples or more use it instead of the NumPy path generators.
+
+``eval_profiles`` is not exported: it is dominated by ``sin``, where NumPy's
+vectorised ufuncs keep up with a serial native loop once a few fields
+oscillate.  Very long flights get Numba's parallel JIT version instead.
+
+```bash
+$ pip install numba
+$ python build_kernels.py
+```
+
+Re-run after changing either kernel; delete the extension to go back to NumPy.
+"""
+from __future__ import annotations
+
+import pathlib, sys
+
+from numba.pycc import CC
+
+sys.modules["flight_kernels"] = None  # build from source, never from a stale extension
+import drone_flight_generator as dfg
+
+cc = CC("flight_kernels")
+cc.output_dir = str(pathlib.Path(__file__).resolve().parent)
+
+cc.export("circle_kernel", "f8[:,:](f8[:,:], f8, f8, f8, f8)")(dfg._circle_kernel)
+cc.export("triangle_kernel", "f8[:,:](f8[:,:], f8[:], f8[:], i8)")(dfg._triangle_kernel)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Wrote {cc.output_dir}/{cc.name} extension")
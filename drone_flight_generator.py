@@ -15,7 +15,8 @@ still work!
 Quick start
 -----------
 ```bash
-# Install Flask once (only needed for --web mode)
+# Install NumPy, plus Flask once (only needed for --web mode)
+$ pip install numpy
 $ pip install flask
 
 # 1. Classic CLI (unchanged)
@@ -33,9 +34,18 @@ expect, but now you can configure flights visually.
 """
 from __future__ import annotations
 
-import argparse, json, math, sys, datetime, pathlib, textwrap, io
+import argparse, csv, functools, itertools, json, math, os, sys, datetime, pathlib, tempfile, textwrap
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Callable
+from typing import List, Tuple, Dict, Callable, Iterable, Iterator
+
+import numpy as np
+
+try:  # orjson is optional – stdlib json is used when it is missing
+    import orjson
+except ImportError:
+    orjson = None
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Maths helpers
@@ -43,14 +53,64 @@ from typing import List, Tuple, Dict, Callable
 
 M_PER_DEG_LAT = 111_320.0  # metres in 1° lat (spheroid avg)
 
-def meters_to_latlon_offset(d_m: float, angle_deg: float, lat_c: float) -> Tuple[float, float]:
-    """Convert polar offset (*d_m*, *angle*) to Δlat/Δlon degrees at latitude *lat_c*."""
-    m_per_deg_lon = M_PER_DEG_LAT * math.cos(math.radians(lat_c))
+_SPLIT = 134217729.0  # 2**27 + 1: Veltkamp split constant for float64
+
+def _round(x: np.ndarray, ndigits: int) -> np.ndarray:
+    """Vectorised built-in :func:`round`: like ``np.round`` but with Python's ties.
+
+    ``np.round`` rounds the inexact product ``x * 10**ndigits``, so values such
+    as 90.35 (really 90.34999…) can round up where ``round()`` rounds down.  At
+    the few products that land exactly on a half, the product's exact rounding
+    error (Dekker's two-product) tells which side the true value lies on.
+    """
+    scale = 10.0 ** ndigits
+    p = x * scale
+    r = np.rint(p)
+    idx = np.flatnonzero(np.abs(p - r) == 0.5)
+    if idx.size:
+        xi, pi = x[idx], p[idx]
+        c = _SPLIT * xi
+        xh = c - (c - xi)
+        xl = xi - xh
+        c = _SPLIT * scale
+        sh = c - (c - scale)
+        sl = scale - sh
+        err = ((xh*sh - pi) + xh*sl + xl*sh) + xl*sl  # xi*scale == pi + err exactly
+        fl = np.floor(pi)
+        r[idx] = np.where(err > 0, fl + 1, np.where(err < 0, fl, r[idx]))
+    np.copysign(r, x, out=r)  # keep round()'s signed zeros
+    return r / scale
+
+def _wave(t: float, period: float) -> float:
+    """``sin(2πt/period)`` evaluated exactly as written (0 for a zero period).
+
+    Every wave ends up rounded (or wrapped by ``% 360``), where the last bit
+    decides ties, so no path replaces the division by a precomputed 2π/period.
+    """
+    return math.sin(2*math.pi*t/period) if period else 0.0
+
+def meters_per_deg_lon(lat_c: float) -> float:
+    """Metres in 1° of longitude at latitude *lat_c*."""
+    return M_PER_DEG_LAT * math.cos(math.radians(lat_c))
+
+def _offset(d_m: float, angle_deg: float, m_per_deg_lon: float) -> Tuple[float, float]:
+    """Polar offset → Δlat/Δlon degrees, given a precomputed :func:`meters_per_deg_lon`."""
     angle_rad = math.radians(angle_deg)
     dlat = (d_m * math.cos(angle_rad)) / M_PER_DEG_LAT
     dlon = (d_m * math.sin(angle_rad)) / m_per_deg_lon
     return dlat, dlon
 
+def meters_to_latlon_offset(d_m: float, angle_deg: float, lat_c: float) -> Tuple[float, float]:
+    """Convert polar offset (*d_m*, *angle*) to Δlat/Δlon degrees at latitude *lat_c*."""
+    return _offset(d_m, angle_deg, meters_per_deg_lon(lat_c))
+
+def _offset_vec(d_m, angle_deg, m_per_deg_lon: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised :func:`_offset` over an array of *angle_deg* (scalar angles use :func:`_offset`)."""
+    angle_rad = np.deg2rad(angle_deg)
+    dlat = (d_m * np.cos(angle_rad)) / M_PER_DEG_LAT
+    dlon = (d_m * np.sin(angle_rad)) / m_per_deg_lon
+    return dlat, dlon
+
 # ───────────────────────────────────────────────────────────────────────────────
 # Profiles (speed, altitude, gimbal)
 # ───────────────────────────────────────────────────────────────────────────────
@@ -62,7 +122,7 @@ class SpeedProfile:
     sine_period: float = 30.0       # s
 
     def speed(self, t: float) -> float:
-        return self.base + self.sine_amp * math.sin(2*math.pi*t/self.sine_period)
+        return self.base + self.sine_amp * _wave(t, self.sine_period)
 
 @dataclass
 class AltitudeProfile:
@@ -72,29 +132,24 @@ class AltitudeProfile:
     sine_amp: float = 0.0                 # m
     sine_period: float = 60.0             # s
 
+    def climb_time(self) -> float:
+        """Time to reach target altitude (0 when not climbing)."""
+        altitude_diff = self.takeoff_altitude - self.takeoff_elevation
+        return altitude_diff / self.climb_rate if self.climb_rate > 0 else 0
+
     def height(self, t: float) -> float:
         # Start at takeoff elevation and climb to target altitude
         if t <= 0:
             return self.takeoff_elevation
-        
-        # Calculate time to reach target altitude
-        altitude_diff = self.takeoff_altitude - self.takeoff_elevation
-        if self.climb_rate > 0:
-            climb_time = altitude_diff / self.climb_rate
-        else:
-            climb_time = 0
-        
-        if t <= climb_time:
+        if t <= self.climb_time():
             # During climb phase
             h = self.takeoff_elevation + self.climb_rate * t
         else:
             # After reaching target altitude
             h = self.takeoff_altitude
-        
         # Add sine wave variation if configured
         if self.sine_amp:
-            h += self.sine_amp * math.sin(2*math.pi*t/self.sine_period)
-        
+            h += self.sine_amp * _wave(t, self.sine_period)
         return h
 
 @dataclass
@@ -121,22 +176,19 @@ class GimbalProfile:
         if self.yaw_mode == "static":
             return (heading + self.yaw_static) % 360
         elif self.yaw_mode == "oscillating":
-            return (heading + self.yaw_amp * math.sin(2*math.pi*t/self.yaw_period)) % 360
+            return (heading + self.yaw_amp * _wave(t, self.yaw_period)) % 360
         elif self.yaw_mode == "rotating":
             return (heading + self.yaw_rotation_rate * t) % 360
         else:
             return heading % 360
 
     def pitch(self, t: float) -> float:
-        if self.pitch_mode == "static":
-            return self.pitch_static
-        elif self.pitch_mode == "oscillating":
-            return self.pitch_mid + (self.pitch_amp/2) * math.sin(2*math.pi*t/self.pitch_period)
-        else:
-            return self.pitch_static
+        if self.pitch_mode == "oscillating":
+            return self.pitch_mid + (self.pitch_amp/2) * _wave(t, self.pitch_period)
+        return self.pitch_static
 
     def roll(self, t: float) -> float:
-        return self.roll_amp * math.sin(2*math.pi*t/self.roll_period)
+        return self.roll_amp * _wave(t, self.roll_period)
 
 @dataclass
 class ZoomProfile:
@@ -147,14 +199,75 @@ class ZoomProfile:
     period: float = 60.0              # s (for oscillating)
 
     def zoom_factor(self, t: float) -> float:
-        if self.mode == "static":
-            return self.static_value
-        elif self.mode == "oscillating":
+        if self.mode == "oscillating":
             # Oscillate between min and max values
             range_val = self.max_value - self.min_value
-            return self.min_value + (range_val/2) * (1 + math.sin(2*math.pi*t/self.period))
-        else:
-            return self.static_value
+            return self.min_value + (range_val/2) * (1 + _wave(t, self.period))
+        return self.static_value
+
+# ───────────────────────────────────────────────────────────────────────────────
+# Vectorised profile evaluation (compiled kernel)
+# ───────────────────────────────────────────────────────────────────────────────
+
+# Integer codes for the string modes so the kernel never compares strings.
+MODE_CODES: Dict[str, int] = {"static": 0, "oscillating": 1, "rotating": 2}
+
+def _make_eval_profiles(prange: Callable = range) -> Callable[..., np.ndarray]:
+    """Build :func:`eval_profiles` around *prange* (``numba.prange`` for the parallel JIT)."""
+    def eval_profiles(t_arr, heading_arr,
+                      base, s_amp, s_p,
+                      te, ta, cr, ct, a_amp, a_p,
+                      ym, ys, ya, yp, yr,
+                      pm, ps, pmid, pa, pp,
+                      ra, rp,
+                      zm, zs, zmin, zmax, zp):
+        """Evaluate every profile over *t_arr*.
+
+        Returns a ``(6, N)`` array whose rows are height, speed, roll, pitch, yaw
+        and zoom – the same values the per-sample profile methods produce.  Each
+        sine is ``sin(2πt/period)`` as in :func:`_wave`, with a zero period
+        meaning no oscillation.
+        """
+        n = t_arr.shape[0]
+        out = np.empty((6, n))
+        for i in prange(n):
+            t = t_arr[i]
+
+            # Altitude: climb from takeoff elevation for *ct* s, then hold (+ optional sine)
+            if t <= 0:
+                h = te
+            else:
+                h = te + cr * t if t <= ct else ta
+                if a_amp != 0:
+                    h += a_amp * (math.sin(2 * math.pi * t / a_p) if a_p else 0.0)
+            out[0, i] = h
+
+            out[1, i] = base + s_amp * (math.sin(2 * math.pi * t / s_p) if s_p else 0.0)
+            out[2, i] = ra * (math.sin(2 * math.pi * t / rp) if rp else 0.0)
+
+            if pm == 1:
+                out[3, i] = pmid + (pa / 2) * (math.sin(2 * math.pi * t / pp) if pp else 0.0)
+            else:
+                out[3, i] = ps
+
+            heading = heading_arr[i]
+            if ym == 0:
+                out[4, i] = (heading + ys) % 360
+            elif ym == 1:
+                out[4, i] = (heading + ya * (math.sin(2 * math.pi * t / yp) if yp else 0.0)) % 360
+            elif ym == 2:
+                out[4, i] = (heading + yr * t) % 360
+            else:
+                out[4, i] = heading % 360
+
+            if zm == 1:
+                out[5, i] = zmin + ((zmax - zmin) / 2) * (1 + (math.sin(2 * math.pi * t / zp) if zp else 0.0))
+            else:
+                out[5, i] = zs
+        return out
+    return eval_profiles
+
+eval_profiles = _make_eval_profiles()
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Flight configuration dataclass
@@ -164,7 +277,7 @@ class ZoomProfile:
 class FlightConfig:
     path_type: str = "circle"      # circle/straight/triangle/hover
     duration: int = 120             # s
-    hz: int = 1                     # samples per second
+    hz: float = 1.0                 # samples per second (may be fractional)
     # circle / triangle
     center_lat: float = 45.53946
     center_lon: float = -122.76394
@@ -180,60 +293,262 @@ class FlightConfig:
     gimbal:   GimbalProfile   = field(default_factory=GimbalProfile)
     zoom:     ZoomProfile     = field(default_factory=ZoomProfile)
 
-    def total_pts(self) -> int: return self.duration * self.hz
+    def __post_init__(self):
+        # 0, negative or NaN rates would yield empty/negative arrays and NaN timestamps
+        if not (self.hz > 0 and math.isfinite(self.hz)):
+            raise ValueError(f"hz must be a positive number, got {self.hz!r}")
+
+    def total_pts(self) -> int:
+        # One sample per t = i/hz with t < duration; the slack absorbs float
+        # error such as 30 * 0.1 == 3.0000000000000004
+        return math.ceil(self.duration * self.hz - 1e-9)
+
+PARALLEL_MIN_PTS = 100_000  # samples before the NumPy fallback spreads rows over threads
+
+def _sine_cache(t: np.ndarray) -> Callable[[float], np.ndarray]:
+    """Return ``sin(period)`` giving the :func:`_wave` of *t* memoised per period.
+
+    Fields sharing a period share one float64 evaluation, computed exactly as
+    the compiled kernel does.  A zero period gives zeros.
+    """
+    memo: Dict[float, np.ndarray] = {}
+
+    def sin(period: float) -> np.ndarray:
+        if period not in memo:
+            memo[period] = np.sin(2*math.pi*t / period) if period else np.zeros(len(t))
+        return memo[period]
+    return sin
+
+def _profiles_numpy(cfg: FlightConfig, t: np.ndarray, heading: np.ndarray) -> np.ndarray:
+    """NumPy equivalent of :func:`eval_profiles`, used when no compiled kernel is available.
+
+    Every wave is the float64 ``sin(2πt/period)`` of the kernel, shared between
+    fields with equal periods (see :func:`_sine_cache`), so both paths round
+    to the same output.  The returned block is float64.
+    """
+    a, s, g, z = cfg.altitude, cfg.speed, cfg.gimbal, cfg.zoom
+    sin = _sine_cache(t)
+
+    def height() -> np.ndarray:
+        h = np.where(t <= a.climb_time(), a.takeoff_elevation + a.climb_rate * t, a.takeoff_altitude)
+        if a.sine_amp:
+            h += a.sine_amp * sin(a.sine_period)
+        h[t <= 0] = a.takeoff_elevation
+        return h
+
+    def speed() -> np.ndarray:
+        return s.base + s.sine_amp * sin(s.sine_period)
+
+    def roll() -> np.ndarray:
+        return g.roll_amp * sin(g.roll_period)
+
+    # One dict lookup per field and flight picks the builder; only it is evaluated
+    pitch = {"oscillating": lambda: g.pitch_mid + (g.pitch_amp / 2) * sin(g.pitch_period)
+             }.get(g.pitch_mode, lambda: g.pitch_static)
+
+    yaw_raw = {
+        "static":      lambda: heading + g.yaw_static,
+        "oscillating": lambda: heading + g.yaw_amp * sin(g.yaw_period),
+        "rotating":    lambda: heading + g.yaw_rotation_rate * t,
+    }.get(g.yaw_mode, lambda: heading)
+
+    def yaw() -> np.ndarray:
+        return np.mod(yaw_raw(), 360)
+
+    zoom = {"oscillating": lambda: z.min_value + ((z.max_value - z.min_value) / 2) * (1 + sin(z.period))
+            }.get(z.mode, lambda: z.static_value)
+
+    # Rows are independent and NumPy releases the GIL inside its loops, so long
+    # flights evaluate them on parallel threads; short ones are not worth it.
+    rows = (height, speed, roll, pitch, yaw, zoom)
+    workers = min(len(rows), os.cpu_count() or 1)
+    out = np.empty((len(rows), len(t)))
+
+    def fill(i: int) -> None:
+        out[i] = rows[i]()
+
+    if workers > 1 and len(t) >= PARALLEL_MIN_PTS:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(fill, range(len(rows))))
+    else:
+        for i in range(len(rows)):
+            fill(i)
+    return out
+
+def profile_arrays(cfg: FlightConfig, t: np.ndarray, heading: np.ndarray) -> np.ndarray:
+    """Return the ``(6, N)`` profile block of :func:`eval_profiles` for *cfg*."""
+    kernel = profile_kernel(len(t))
+    if kernel is None:
+        return _profiles_numpy(cfg, t, heading)
+
+    a, s, g, z = cfg.altitude, cfg.speed, cfg.gimbal, cfg.zoom
+    return kernel(
+        np.ascontiguousarray(t, dtype=np.float64), np.ascontiguousarray(heading, dtype=np.float64),
+        float(s.base), float(s.sine_amp), float(s.sine_period),
+        float(a.takeoff_elevation), float(a.takeoff_altitude), float(a.climb_rate),
+        float(a.climb_time()), float(a.sine_amp), float(a.sine_period),
+        MODE_CODES.get(g.yaw_mode, -1), float(g.yaw_static), float(g.yaw_amp),
+        float(g.yaw_period), float(g.yaw_rotation_rate),
+        MODE_CODES.get(g.pitch_mode, -1), float(g.pitch_static), float(g.pitch_mid),
+        float(g.pitch_amp), float(g.pitch_period),
+        float(g.roll_amp), float(g.roll_period),
+        MODE_CODES.get(z.mode, -1), float(z.static_value), float(z.min_value),
+        float(z.max_value), float(z.period))
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Path generators
 # ───────────────────────────────────────────────────────────────────────────────
 
-PathFunc = Callable[[FlightConfig], List[Tuple[float, float, float]]]
-
-def gen_circle(cfg: FlightConfig) -> List[Tuple[float, float, float]]:
-    out = []
-    for i in range(cfg.total_pts()):
-        frac = i / cfg.total_pts()
-        ang = frac * 360.0
-        dlat, dlon = meters_to_latlon_offset(cfg.radius_m, ang, cfg.center_lat)
-        lat = cfg.center_lat + dlat
-        lon = cfg.center_lon + dlon
-        heading = (ang + 90) % 360
-        out.append((lat, lon, heading))
+# Each generator returns an (N, 3) float64 array of (lat, lon, heading) rows.
+PathFunc = Callable[[FlightConfig], np.ndarray]
+
+def _circle_kernel(out, lat_c, lon_c, radius, m_per_deg_lon):
+    """Fill *out* with circle samples using a rotation recurrence instead of sin/cos."""
+    n = out.shape[0]
+    if n == 0:
+        return out
+    dtheta = 2 * math.pi / n
+    cdt, sdt = math.cos(dtheta), math.sin(dtheta)
+    c, s = 1.0, 0.0
+    for i in range(n):
+        out[i, 0] = lat_c + radius * c / M_PER_DEG_LAT
+        out[i, 1] = lon_c + radius * s / m_per_deg_lon
+        out[i, 2] = ((i / n) * 360.0 + 90) % 360
+        c, s = c * cdt - s * sdt, s * cdt + c * sdt
+        if i % 1000 == 999:
+            # Re-normalise so rounding error cannot grow the radius
+            k = 1.5 - 0.5 * (c * c + s * s)
+            c *= k
+            s *= k
     return out
 
-def gen_straight(cfg: FlightConfig) -> List[Tuple[float, float, float]]:
+def _triangle_kernel(out, vlat, vlon, pts_per_edge):
+    """Fill *out* edge by edge between the three vertices, holding the last sample."""
+    for e in range(3):
+        lat1, lon1 = vlat[e], vlon[e]
+        dlat, dlon = vlat[(e+1) % 3] - lat1, vlon[(e+1) % 3] - lon1
+        hdg = math.degrees(math.atan2(dlon, dlat)) % 360
+        for j in range(pts_per_edge):
+            f = j / pts_per_edge
+            i = e * pts_per_edge + j
+            out[i, 0] = lat1 + f * dlat
+            out[i, 1] = lon1 + f * dlon
+            out[i, 2] = hdg
+    last = 3 * pts_per_edge - 1
+    for i in range(last + 1, out.shape[0]):
+        out[i, 0] = out[last, 0]
+        out[i, 1] = out[last, 1]
+        out[i, 2] = out[last, 2]
+    return out
+
+# The flight_kernels extension loads in well under a millisecond and its path
+# loops run 2.5-4x faster than NumPy; loading Numba and its cached kernels costs
+# ~0.5 s per process, so the JIT is only worth it on very long flights.
+AOT_MIN_PTS = 20_000     # samples before the extension's path kernels replace NumPy
+JIT_MIN_PTS = 5_000_000  # samples before the Numba kernels replace the NumPy paths
+
+@functools.lru_cache(maxsize=1)
+def aot_kernels() -> SimpleNamespace | None:
+    """The path kernels of the ``flight_kernels`` extension (build_kernels.py), if built."""
+    try:
+        import flight_kernels
+    except ImportError:
+        return None
+    return SimpleNamespace(circle=flight_kernels.circle_kernel,
+                           triangle=flight_kernels.triangle_kernel)
+
+@functools.lru_cache(maxsize=1)
+def jit_kernels() -> SimpleNamespace | None:
+    """JIT-compile the kernels on first use; ``None`` without Numba.
+
+    Numba is only imported here, never at startup.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return SimpleNamespace(
+        eval_profiles=numba.njit(parallel=True, cache=True)(_make_eval_profiles(numba.prange)),
+        circle=numba.njit(cache=True)(_circle_kernel),
+        triangle=numba.njit(cache=True)(_triangle_kernel))
+
+def path_kernels(n: int) -> SimpleNamespace | None:
+    """Compiled circle/triangle kernels if they beat NumPy on an *n*-sample flight."""
+    kernels = aot_kernels() if n >= AOT_MIN_PTS else None
+    if kernels is None and n >= JIT_MIN_PTS:
+        kernels = jit_kernels()
+    return kernels
+
+def profile_kernel(n: int) -> Callable[..., np.ndarray] | None:
+    """The JIT :func:`eval_profiles` if an *n*-sample flight is long enough to repay Numba."""
+    kernels = jit_kernels() if n >= JIT_MIN_PTS else None
+    return kernels.eval_profiles if kernels is not None else None
+
+@functools.lru_cache(maxsize=8)
+def _circle_arrays(center_lat: float, center_lon: float, radius: float, n: int) -> np.ndarray:
+    """Memoised circle samples; the array is read-only, so copy before mutating."""
+    out = np.empty((n, 3))
+    kernels = path_kernels(n)
+    if kernels is not None:
+        kernels.circle(out, center_lat, center_lon, radius, meters_per_deg_lon(center_lat))
+    else:
+        ang = np.arange(n) / n * 360.0 if n else np.empty(0)
+        dlat, dlon = _offset_vec(radius, ang, meters_per_deg_lon(center_lat))
+        np.add(center_lat, dlat, out=out[:, 0])
+        np.add(center_lon, dlon, out=out[:, 1])
+        np.mod(ang + 90, 360, out=out[:, 2])
+    out.flags.writeable = False
+    return out
+
+def gen_circle(cfg: FlightConfig) -> np.ndarray:
+    # Repeat flights (e.g. the web UI defaults) reuse the cached array
+    return _circle_arrays(float(cfg.center_lat), float(cfg.center_lon),
+                          float(cfg.radius_m), cfg.total_pts())
+
+def gen_straight(cfg: FlightConfig) -> np.ndarray:
     total_dist = cfg.speed.base * cfg.duration  # naive (ignores variability)
-    step = total_dist / cfg.total_pts()
+    n = cfg.total_pts()
+    step = total_dist / n
     lat0, lon0 = cfg.start_lat, cfg.start_lon
-    out = []
-    for i in range(cfg.total_pts()):
-        d = step * i
-        dlat, dlon = meters_to_latlon_offset(d, cfg.bearing_deg, lat0)
-        out.append((lat0 + dlat, lon0 + dlon, cfg.bearing_deg % 360))
+    out = np.empty((n, 3))
+    dist = step * np.arange(n)
+    # The bearing is a scalar: math trig, not a NumPy ufunc call per value
+    brg = math.radians(cfg.bearing_deg)
+    np.add(lat0, dist * math.cos(brg) / M_PER_DEG_LAT, out=out[:, 0])
+    np.add(lon0, dist * math.sin(brg) / meters_per_deg_lon(lat0), out=out[:, 1])
+    out[:, 2] = cfg.bearing_deg % 360
     return out
 
-def gen_hover(cfg: FlightConfig) -> List[Tuple[float, float, float]]:
-    return [(cfg.start_lat, cfg.start_lon, cfg.bearing_deg % 360)] * cfg.total_pts()
+def gen_hover(cfg: FlightConfig) -> np.ndarray:
+    # One point repeated: a read-only broadcast view, O(1) memory
+    pt = np.array([cfg.start_lat, cfg.start_lon, cfg.bearing_deg % 360])
+    return np.broadcast_to(pt, (cfg.total_pts(), 3))
 
-def gen_triangle(cfg: FlightConfig) -> List[Tuple[float, float, float]]:
+def gen_triangle(cfg: FlightConfig) -> np.ndarray:
+    m_per_deg_lon = meters_per_deg_lon(cfg.center_lat)
     verts: List[Tuple[float, float]] = []
     for k in range(3):
         ang = 90 + k*120
-        dlat, dlon = meters_to_latlon_offset(cfg.tri_edge_m/math.sqrt(3), ang, cfg.center_lat)
+        dlat, dlon = _offset(cfg.tri_edge_m/math.sqrt(3), ang, m_per_deg_lon)
         verts.append((cfg.center_lat+dlat, cfg.center_lon+dlon))
 
     pts_per_edge = cfg.total_pts() // 3 or 1
-    out: List[Tuple[float, float, float]] = []
+    n_edges = 3 * pts_per_edge
+    out = np.empty((max(cfg.total_pts(), n_edges), 3))
+    kernels = path_kernels(len(out))
+    if kernels is not None:
+        vlat, vlon = np.array(verts).T.copy()
+        return kernels.triangle(out, vlat, vlon, pts_per_edge)
+    frac = np.arange(pts_per_edge) / pts_per_edge
     for e in range(3):
         lat1, lon1 = verts[e]
         lat2, lon2 = verts[(e+1)%3]
-        for j in range(pts_per_edge):
-            t = j/pts_per_edge
-            lat = lat1 + t*(lat2-lat1)
-            lon = lon1 + t*(lon2-lon1)
-            heading = math.degrees(math.atan2(lon2-lon1, lat2-lat1)) % 360
-            out.append((lat, lon, heading))
-    while len(out) < cfg.total_pts():
-        out.append(out[-1])
+        seg = out[e*pts_per_edge:(e+1)*pts_per_edge]
+        np.add(lat1, frac*(lat2-lat1), out=seg[:, 0])
+        np.add(lon1, frac*(lon2-lon1), out=seg[:, 1])
+        seg[:, 2] = math.degrees(math.atan2(lon2-lon1, lat2-lat1)) % 360
+    # Hold the last sample until the flight duration is covered
+    out[n_edges:] = out[n_edges - 1]
     return out
 
 PATHS: Dict[str, PathFunc] = {
@@ -247,41 +562,184 @@ PATHS: Dict[str, PathFunc] = {
 # Entry generation
 # ───────────────────────────────────────────────────────────────────────────────
 
-def generate_entries(cfg: FlightConfig):
+def flight_columns(cfg: FlightConfig) -> Dict[str, np.ndarray]:
+    """Compute every output field as a column array keyed by its JSON name.
+
+    Columns are already rounded to the precision written to disk;
+    ``current_datetime`` is a ``datetime64[us]`` array.
+    """
     gen = PATHS[cfg.path_type]
-    path_pts = gen(cfg)
+    path_pts = np.asarray(gen(cfg), dtype=np.float64).reshape(-1, 3)
     start_time = datetime.datetime.now()
 
-    entries, flight_dist = [], 0.0
-    for i, (lat, lon, heading) in enumerate(path_pts):
-        t = i / cfg.hz
-        speed = cfg.speed.speed(t)
-        flight_dist += speed / cfg.hz
-        entries.append({
+    t = np.arange(len(path_pts)) / cfg.hz
+    lat, lon, heading = path_pts.T
+    height, speed, roll, pitch, yaw, zoom = profile_arrays(cfg, t, heading)
+    flight_dist = np.cumsum(speed) / cfg.hz
+    offsets_us = np.rint(t * 1e6).astype(np.int64).astype("timedelta64[us]")
+    roll = _round(roll, 2)
+
+    return {
+        "latitude":         _round(lat, 6),
+        "longitude":        _round(lon, 6),
+        "height":           _round(height, 1),
+        "elevation":        np.zeros(len(t), dtype=np.int64),
+        "attitude_head":    _round(heading, 1),
+        "attitude_roll":    roll,  # re‑use
+        "attitude_pitch":   np.zeros(len(t)),
+        "gimbal_pitch":     _round(pitch, 1),
+        "gimbal_roll":      roll,
+        "gimbal_yaw":       _round(yaw, 1),
+        "zoom_factor":      _round(zoom, 2),
+        "speed":            _round(speed, 2),
+        "seconds_elapsed":  t.astype(np.int64),
+        "current_datetime": np.datetime64(start_time, "us") + offsets_us,
+        "flight_distance":  _round(flight_dist, 1),
+    }
+
+def entries_from_columns(cols: Dict[str, np.ndarray]) -> Iterator[dict]:
+    """Yield ``{"data": {...}}`` entries from :func:`flight_columns` output."""
+    # Each column is unboxed with a single tolist(); only the dict assembly is per-sample.
+    yield from (
+        {
             "data": {
-                "latitude":        round(lat, 6),
-                "longitude":       round(lon, 6),
-                "height":          round(cfg.altitude.height(t), 1),
+                "latitude":        la,
+                "longitude":       lo,
+                "height":          h,
                 "elevation":       0,
-                "attitude_head":   round(heading, 1),
-                "attitude_roll":   round(cfg.gimbal.roll(t), 2),  # re‑use
+                "attitude_head":   hd,
+                "attitude_roll":   r,
                 "attitude_pitch":  0.0,
-                "gimbal_pitch":    round(cfg.gimbal.pitch(t), 1),
-                "gimbal_roll":     round(cfg.gimbal.roll(t), 2),
-                "gimbal_yaw":      round(cfg.gimbal.yaw(heading, t), 1),
-                "zoom_factor":     round(cfg.zoom.zoom_factor(t), 2),
-                "speed":           round(speed, 2),
-                "seconds_elapsed": int(t),
-                "current_datetime": (start_time + datetime.timedelta(seconds=t)).isoformat(),
-                "flight_distance": round(flight_dist, 1),
+                "gimbal_pitch":    p,
+                "gimbal_roll":     r,
+                "gimbal_yaw":      y,
+                "zoom_factor":     z,
+                "speed":           sp,
+                "seconds_elapsed": sec,
+                "current_datetime": iso,
+                "flight_distance": d,
             }
-        })
-    return entries
+        }
+        for la, lo, hd, h, sp, r, p, y, z, sec, iso, d in zip(
+            cols["latitude"].tolist(), cols["longitude"].tolist(),
+            cols["attitude_head"].tolist(), cols["height"].tolist(),
+            cols["speed"].tolist(), cols["gimbal_roll"].tolist(), cols["gimbal_pitch"].tolist(),
+            cols["gimbal_yaw"].tolist(), cols["zoom_factor"].tolist(),
+            cols["seconds_elapsed"].tolist(),
+            np.datetime_as_string(cols["current_datetime"], unit="us").tolist(),
+            cols["flight_distance"].tolist())
+    )
+
+def iter_entries(cfg: FlightConfig) -> Iterator[dict]:
+    """Yield the flight's entries one at a time (the arrays behind them are built up front)."""
+    return entries_from_columns(flight_columns(cfg))
+
+def generate_entries(cfg: FlightConfig) -> List[dict]:
+    return list(iter_entries(cfg))
+
+# ───────────────────────────────────────────────────────────────────────────────
+# JSON output
+# ───────────────────────────────────────────────────────────────────────────────
+
+def _json_default(obj):
+    """stdlib ``json`` hook: NumPy arrays and scalars become plain Python values."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    """Encode *obj* as UTF‑8 JSON bytes, using orjson when it is installed.
+
+    NumPy arrays and scalars are accepted directly (orjson encodes them natively).
+    """
+    if orjson is not None:
+        opts = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=opts)
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default).encode()
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+JSON_BATCH = 1024  # entries joined into each chunk handed to write()
+
+def _dumps_nested(obj) -> bytes:
+    """Indented encoding of one array element, shifted in by one level."""
+    return b"  " + dumps_json(obj, indent=True).replace(b"\n", b"\n  ")
+
+def iter_json(entries: Iterable[dict], batch: int = JSON_BATCH,
+              pretty: bool = False) -> Iterator[bytes]:
+    """Yield *entries* as byte chunks of a JSON array, one entry per line.
+
+    Rows are encoded and joined *batch* at a time, so a writer issues one
+    ``write()`` per chunk rather than one per entry while memory stays bounded.
+    With *pretty* every entry is indented by two spaces per level instead.
+    """
+    enc = _dumps_nested if pretty else dumps_json
+    it = iter(entries)
+    sep = b"[\n"
+    while True:
+        rows = [enc(e) for e in itertools.islice(it, batch)]
+        if not rows:
+            break
+        yield sep + b",\n".join(rows)
+        sep = b",\n"
+    yield b"[\n]\n" if sep == b"[\n" else b"\n]\n"
+
+def dump_entries(entries: Iterable[dict], fh, pretty: bool = False) -> None:
+    """Stream *entries* into binary file *fh* as a JSON array (compact unless *pretty*)."""
+    fh.writelines(iter_json(entries, pretty=pretty))
+
+def write_entries(path: pathlib.Path, cfg: FlightConfig, pretty: bool = False) -> Dict[str, np.ndarray]:
+    """Stream *cfg*'s entries to *path* as JSON and return the columns behind them.
+
+    Entries are built and written batch by batch, never held as one list; the
+    returned columns let callers summarise the flight without a second pass.
+    """
+    cols = flight_columns(cfg)
+    with open(path, "wb") as fh:
+        dump_entries(entries_from_columns(cols), fh, pretty=pretty)
+    return cols
+
+# ───────────────────────────────────────────────────────────────────────────────
+# Tabular output (CSV / Parquet)
+# ───────────────────────────────────────────────────────────────────────────────
+
+def write_csv(cols: Dict[str, np.ndarray], path: pathlib.Path) -> None:
+    """Write the flight columns as a flat CSV file with a header row."""
+    values = [c.tolist() for c in cols.values()]
+    values[list(cols).index("current_datetime")] = \
+        np.datetime_as_string(cols["current_datetime"], unit="us").tolist()
+    with path.open("w", newline="") as fh:
+        w = csv.writer(fh)
+        w.writerow(cols)
+        w.writerows(zip(*values))
+
+def write_parquet(cols: Dict[str, np.ndarray], path: pathlib.Path) -> None:
+    """Write the flight columns as a zstd-compressed Parquet file."""
+    try:
+        import pyarrow as pa, pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("pyarrow is not installed. Run 'pip install pyarrow' and try again.")
+    pq.write_table(pa.table(cols), str(path), compression="zstd")
+
+TABLE_WRITERS: Dict[str, Callable[[Dict[str, np.ndarray], pathlib.Path], None]] = {
+    "csv": write_csv,
+    "parquet": write_parquet,
+}
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Config helpers (CLI ↔ dataclass)
 # ───────────────────────────────────────────────────────────────────────────────
 
+def positive_float(text: str) -> float:
+    """argparse ``type=`` for strictly positive, finite floats (e.g. ``--hz``)."""
+    try:
+        val = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {text!r}") from None
+    if not (val > 0 and math.isfinite(val)):
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text!r}")
+    return val
+
 def build_config(ns: argparse.Namespace) -> FlightConfig:
     cfg = FlightConfig(path_type=ns.path, duration=ns.duration, hz=ns.hz)
     if cfg.path_type in {"circle", "triangle"} and ns.center:
@@ -339,7 +797,7 @@ def build_config(ns: argparse.Namespace) -> FlightConfig:
         cfg.zoom.max_value = ns.zoom_max
     if hasattr(ns, 'zoom_period') and ns.zoom_period is not None:
         cfg.zoom.period = ns.zoom_period
-    
+
     return cfg
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -355,7 +813,7 @@ def interactive_prompt() -> argparse.Namespace:
     ns = argparse.Namespace()
     ns.path = ask("Path type circle/straight/triangle/hover", str, "circle")
     ns.duration = ask("Duration (s)", int, 120)
-    ns.hz = ask("Sample rate (Hz)", int, 1)
+    ns.hz = ask("Sample rate (Hz)", positive_float, 1.0)
 
     if ns.path in {"circle", "triangle"}:
         ns.center = ask("Center lat,lon", str, "45.53946,-122.76394")
@@ -415,14 +873,41 @@ def interactive_prompt() -> argparse.Namespace:
 # Web UI (Flask)
 # ───────────────────────────────────────────────────────────────────────────────
 
+def _write_flight_file(cfg: FlightConfig) -> str:
+    """Worker job: write *cfg*'s entries to a temporary JSON file and return its path."""
+    fd, tmp = tempfile.mkstemp(prefix="flight_", suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            dump_entries(iter_entries(cfg), fh)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return tmp
+
 def run_web_ui():
     try:
-        from flask import Flask, render_template_string, request, send_file
+        from flask import Flask, Response, make_response, render_template, request
     except ImportError:
         sys.exit("Flask is not installed. Run 'pip install flask' and try again.")
 
     app = Flask(__name__)
+    if orjson is not None:
+        from flask.json.provider import JSONProvider
+
+        class OrjsonProvider(JSONProvider):
+            """Route ``jsonify``/``request.get_json`` through orjson."""
+
+            def dumps(self, obj, **kwargs) -> str:
+                return dumps_json(obj).decode()
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = OrjsonProvider(app)
     DEFAULT_CFG = FlightConfig()
+    # Flights are generated in worker processes so long ones neither hold the
+    # GIL nor block other requests, and several can run on separate cores.
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count())
 
     TEMPLATE = """<!doctype html>
 <title>Drone Flight Data Generator</title>
@@ -446,7 +931,7 @@ def run_web_ui():
       </div>
       <div class=col>
         <label class=form-label>Sample rate (Hz)</label>
-        <input type=number name=hz class="form-control" value="{{cfg.hz}}">
+        <input type=number name=hz class="form-control" value="{{cfg.hz}}" min="0.001" step="any">
       </div>
     </div>
     
@@ -627,22 +1112,33 @@ window.addEventListener('DOMContentLoaded',function(){
 });
 </script>
 """
+    # Parse and compile the form once; render_template_string would redo it per request
+    FORM = app.jinja_env.from_string(TEMPLATE)
+
+    @functools.lru_cache(maxsize=1)
+    def default_form() -> Tuple[str, str]:
+        """The GET page only ever shows the defaults: render it and its ETag once."""
+        from werkzeug.http import generate_etag
+        html = render_template(FORM, cfg=DEFAULT_CFG)
+        return html, generate_etag(html.encode())
 
     @app.route('/', methods=['GET', 'POST'])
     def index():
-        cfg = DEFAULT_CFG
         if request.method == 'POST':
             # Parse form data
             args = argparse.Namespace(
                 path=request.form['path'],
                 duration=int(request.form['duration']),
-                hz=int(request.form['hz']),
+                hz=float(request.form['hz']),
                 center=request.form.get('center'),
                 radius=float(request.form.get('radius') or 0) or None,
                 tri_edge=float(request.form.get('tri_edge') or 0) or None,
                 start=request.form.get('start'),
                 bearing=float(request.form.get('bearing') or 0) or None,
                 outfile='web.json')
+            if not (args.hz > 0 and math.isfinite(args.hz)):
+                return Response("Sample rate (hz) must be greater than 0.\n", status=400,
+                                mimetype='text/plain')
             
             cfg = build_config(args)
             
@@ -673,33 +1169,67 @@ window.addEventListener('DOMContentLoaded',function(){
             cfg.zoom.max_value = float(request.form.get('zoom_max', 3.0))
             cfg.zoom.period = float(request.form.get('zoom_period', 60))
             
-            data = json.dumps(generate_entries(cfg), indent=2).encode()
-            buf = io.BytesIO(data)
-            buf.seek(0)
-            fname = f"{cfg.path_type}_{datetime.datetime.now().strftime('%Y%m%dT%H%M%S')}.json"
-            return send_file(buf, as_attachment=True, download_name=fname, mimetype='application/json')
+            # The worker streams the rows to a temp file, which is then sent in chunks
+            tmp = executor.submit(_write_flight_file, cfg).result()
 
-        return render_template_string(TEMPLATE, cfg=cfg)
+            def stream():
+                with open(tmp, 'rb') as fh:
+                    yield from iter(lambda: fh.read(1 << 16), b'')
+
+            def cleanup():
+                # Runs when the server closes the response, even if the body never started
+                try:
+                    os.remove(tmp)
+                except FileNotFoundError:
+                    pass
+
+            fname = f"{cfg.path_type}_{datetime.datetime.now().strftime('%Y%m%dT%H%M%S')}.json"
+            resp = Response(stream(), mimetype='application/json',
+                            headers={'Content-Disposition': f'attachment; filename={fname}'})
+            resp.call_on_close(cleanup)
+            return resp
+
+        # Browsers revalidate with If-None-Match and get a bodiless 304 back
+        html, etag = default_form()
+        resp = make_response(html)
+        resp.set_etag(etag)
+        resp.cache_control.max_age = 300
+        return resp.make_conditional(request)
 
     print("* Running on http://127.0.0.1:5001/ (Ctrl+C to quit)")
-    app.run(debug=False, port=5001)
+    with executor:
+        try:  # waitress is optional – a production server with a pool of request threads
+            from waitress import serve
+        except ImportError:
+            app.run(debug=False, port=5001)
+        else:
+            serve(app, host='127.0.0.1', port=5001, threads=8)
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Main entry‑point
 # ───────────────────────────────────────────────────────────────────────────────
 
-def main(argv: List[str] | None = None):
+_DESC = textwrap.dedent(__doc__ or '')
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated ``main()`` calls reuse it."""
     p = argparse.ArgumentParser(formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=textwrap.dedent(__doc__))
+        description=_DESC)
     p.add_argument('--path', choices=PATHS.keys(), default='circle')
     p.add_argument('--duration', type=int, default=120)
-    p.add_argument('--hz', type=int, default=1)
+    p.add_argument('--hz', type=positive_float, default=1.0,
+                   help='Output sample rate; fractional values (e.g. 0.2) decimate directly')
     p.add_argument('--center')
     p.add_argument('--radius', type=float)
     p.add_argument('--start')
     p.add_argument('--bearing', type=float)
     p.add_argument('--tri_edge', type=float)
-    p.add_argument('--outfile', default='flight_data.json')
+    p.add_argument('--outfile', help='Output file (default flight_data.<format>)')
+    p.add_argument('--format', choices=['json', *TABLE_WRITERS], default='json',
+                   help='Output format; csv/parquet are flat, columnar alternatives to JSON')
+    p.add_argument('--pretty', action='store_true',
+                   help='Indent JSON output for reading (default is compact)')
     p.add_argument('--interactive', action='store_true')
     p.add_argument('--web', action='store_true', help='Launch Flask UI')
     
@@ -729,8 +1259,10 @@ def main(argv: List[str] | None = None):
     p.add_argument('--zoom-min', type=float, default=1.0)
     p.add_argument('--zoom-max', type=float, default=3.0)
     p.add_argument('--zoom-period', type=float, default=60.0)
+    return p
 
-    args = p.parse_args(argv)
+def main(argv: List[str] | None = None):
+    args = _get_parser().parse_args(argv)
 
     if args.web:
         run_web_ui()
@@ -740,19 +1272,23 @@ def main(argv: List[str] | None = None):
         args = interactive_prompt()
 
     cfg = build_config(args)
-    entries = generate_entries(cfg)
-    path = pathlib.Path(args.outfile)
-    path.write_text(json.dumps(entries, indent=2))
-    print(f"Wrote {len(entries)} points to {path.resolve()}")
-
-    pitch = [e['data']['gimbal_pitch'] for e in entries]
-    yaw   = [e['data']['gimbal_yaw']   for e in entries]
-    spd   = [e['data']['speed']        for e in entries]
-    zoom  = [e['data']['zoom_factor']  for e in entries]
-    print(f"gimbal_pitch: {min(pitch):.1f} … {max(pitch):.1f}")
-    print(f"gimbal_yaw:   {min(yaw):.1f} … {max(yaw):.1f}")
-    print(f"speed:        {min(spd):.1f} … {max(spd):.1f}")
-    print(f"zoom_factor:  {min(zoom):.2f} … {max(zoom):.2f}")
+    fmt = getattr(args, 'format', 'json')
+    path = pathlib.Path(args.outfile or f"flight_data.{fmt}")
+    if fmt == 'json':
+        cols = write_entries(path, cfg, pretty=getattr(args, 'pretty', False))
+    else:
+        cols = flight_columns(cfg)
+        TABLE_WRITERS[fmt](cols, path)
+    print(f"Wrote {len(cols['latitude'])} points to {path}")
+
+    if not len(cols['latitude']):
+        return
+    # Reduce the column arrays in place – no stacked copy, no per-entry lookups
+    pitch, yaw, speed, zoom = (cols[k] for k in ('gimbal_pitch', 'gimbal_yaw', 'speed', 'zoom_factor'))
+    print(f"gimbal_pitch: {pitch.min():.1f} … {pitch.max():.1f}")
+    print(f"gimbal_yaw:   {yaw.min():.1f} … {yaw.max():.1f}")
+    print(f"speed:        {speed.min():.1f} … {speed.max():.1f}")
+    print(f"zoom_factor:  {zoom.min():.2f} … {zoom.max():.2f}")
 
 if __name__ == '__main__':
     main()